@@ -11,8 +11,11 @@ Usage:
 """
 
 import random
-from dataclasses import asdict, dataclass, field
-from typing import Dict, List, Optional
+import sys
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Callable, Deque, Dict, Mapping, NamedTuple, Optional, Tuple
 
 from google.adk import Agent
 from google.adk.tools import FunctionTool
@@ -22,22 +25,82 @@ from google.adk.tools import FunctionTool
 # GAME CONSTANTS
 # ============================================================================
 
+# Canonical move strings, interned so validate_move_tool() can recognise the
+# values returned by interpret_intent() with an identity check (`is`).
+_ROCK = sys.intern("rock")
+_PAPER = sys.intern("paper")
+_SCISSORS = sys.intern("scissors")
+_BOMB = sys.intern("bomb")
+
 # Set of all valid player moves. 'bomb' is a special move that beats everything.
-VALID_MOVES = {"rock", "paper", "scissors", "bomb"}
+VALID_MOVES = frozenset((_ROCK, _PAPER, _SCISSORS, _BOMB))
 
 # Defines what each move beats in classic Rock-Paper-Scissors (not bomb).
 # Key: player's move, Value: what it beats
+# The rules are applied through Move arithmetic (see Move); tests check that
+# the two always agree.
 RPS_BEATS = {"rock": "scissors", "paper": "rock", "scissors": "paper"}
 
+
+class Move(IntEnum):
+    """Integer code for each move, for table lookups and batch simulation.
+    
+    Rock/paper/scissors are ordered so that the RPS_BEATS rule becomes
+    arithmetic: a beats b  <=>  (a - b) % 3 == 1.
+    """
+
+    ROCK = 0
+    PAPER = 1
+    SCISSORS = 2
+    BOMB = 3
+
+
+# Move name ↔ Move code. Strings stay the I/O format; codes are for hot paths.
+MOVE_IDS = {_ROCK: Move.ROCK, _PAPER: Move.PAPER, _SCISSORS: Move.SCISSORS, _BOMB: Move.BOMB}
+MOVE_NAMES = (_ROCK, _PAPER, _SCISSORS, _BOMB)
+_BOMB_CODE = int(Move.BOMB)
+
+# Maximum number of rounds kept in GameState.history. Older rounds are dropped
+# automatically, so a long-running referee (server, tournament replay) uses
+# constant memory.
+MAX_HISTORY = 10_000
+
+# Pools the bot samples from (fixed tuples, so no list is built per round).
+# Both are prefixes of MOVE_NAMES, so a pool index is also the Move code.
+_BOT_MOVES_NO_BOMB = MOVE_NAMES[:3]
+_BOT_MOVES_WITH_BOMB = MOVE_NAMES
+_randrange = random.randrange
+
+# Normalized user text → canonical (interned) move, for interpret_intent(),
+# and → plain int move code, for play_round_fast().
+_MOVE_ALIASES = {move: move for move in VALID_MOVES}
+_MOVE_CODE_ALIASES = {move: int(code) for move, code in MOVE_IDS.items()}
+
 # Emoji labels for friendly CLI display.
 MOVE_EMOJI = {
     "rock": "rock 🪨",
     "paper": "paper 📄",
     "scissors": "scissors ✂️",
     "bomb": "bomb 💣",
-    "none": "none",
 }
-@dataclass
+
+# Display strings for format_round_response(), prebuilt for every move pair
+# and winner so formatting a round is just a few dict reads.
+_MOVES_LINE = {
+    (user_move, bot_move): f"Moves: You={MOVE_EMOJI[user_move]} | Bot={MOVE_EMOJI[bot_move]}"
+    for user_move in VALID_MOVES
+    for bot_move in VALID_MOVES
+}
+_WINNER_TEXT = {"user": "You", "bot": "Bot", "draw": "Draw"}
+
+# Full play_round() error text for each validation failure reason.
+_INVALID_MESSAGES = {
+    reason: f"Invalid move.\nReason: {reason}.\nPlease enter rock, paper, scissors, or bomb."
+    for reason in ("empty input", "unknown move", "bomb already used")
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Structured response from validate_move_tool().
     
@@ -46,6 +109,9 @@ class ValidationResult:
     - Tool outputs are consistent and testable
     - Easier to extend (e.g., add error codes) later
     
+    Frozen (immutable and hashable), since every possible result is built
+    once at import time and shared.
+    
     Attributes:
         valid: Boolean indicating if the move is legal
         reason: Human-readable explanation for invalid moves
@@ -54,8 +120,19 @@ class ValidationResult:
     valid: bool
     reason: str
 
+    def to_dict(self) -> Dict[str, object]:
+        """Return a flat dict of the fields (no deep copy, unlike asdict)."""
+        return {"valid": self.valid, "reason": self.reason}
 
-@dataclass
+
+# Every possible validate_move_tool() result, built once at import time.
+_VR_OK = ValidationResult(valid=True, reason="ok").to_dict()
+_VR_INVALID = {
+    reason: ValidationResult(valid=False, reason=reason).to_dict() for reason in _INVALID_MESSAGES
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ResolutionResult:
     """Structured response from resolve_round_tool().
     
@@ -67,13 +144,75 @@ class ResolutionResult:
     winner: str
     explanation: str
 
+    def to_dict(self) -> Dict[str, str]:
+        """Return a flat dict of the fields (no deep copy, unlike asdict)."""
+        return {"winner": self.winner, "explanation": self.explanation}
+
+
+def _resolve_round_rules(user_move: str, bot_move: str) -> ResolutionResult:
+    """Apply the win rules to one move pair (used to build _RESOLUTION).
+    
+    Win logic (in order of precedence):
+    1. Same move → draw (this covers bomb vs bomb too)
+    2. Bomb vs anything else → bomb wins
+    3. Standard Rock-Paper-Scissors logic (RPS_BEATS, as Move arithmetic)
+    """
+    if user_move == bot_move:
+        return ResolutionResult(winner="draw", explanation="Same move.")
+    if user_move == "bomb":
+        return ResolutionResult(winner="user", explanation="Bomb beats all other moves.")
+    if bot_move == "bomb":
+        return ResolutionResult(winner="bot", explanation="Bomb beats all other moves.")
+    if (MOVE_IDS[user_move] - MOVE_IDS[bot_move]) % 3 == 1:
+        return ResolutionResult(winner="user", explanation=f"{user_move} beats {bot_move}.")
+    return ResolutionResult(winner="bot", explanation=f"{bot_move} beats {user_move}.")
+
+
+# Every (user_move, bot_move) outcome, precomputed once: 4 x 4 = 16 entries.
+_RESOLUTION = {
+    (user_move, bot_move): _resolve_round_rules(user_move, bot_move).to_dict()
+    for user_move in VALID_MOVES
+    for bot_move in VALID_MOVES
+}
+
+# The same table as a flat tuple of immutable (winner, explanation) pairs for
+# play_round() and play_round_fast(), indexed by user_code * 4 + bot_code
+# (see Move).
+_OUTCOME_TABLE = tuple(
+    (result["winner"], result["explanation"])
+    for result in (
+        _RESOLUTION[user_move, bot_move] for user_move in MOVE_NAMES for bot_move in MOVE_NAMES
+    )
+)
+
 
 # ============================================================================
 # DATA MODELS
 # ============================================================================
 
 
-@dataclass
+class RoundRecord(NamedTuple):
+    """One completed round, as stored in GameState.history.
+    
+    A tuple is much smaller than a dict and cheaper to build, and fields
+    are still read by name (record.winner).
+    
+    Attributes:
+        round_number: 1-based round number
+        user_move: The user's move
+        bot_move: The bot's move
+        winner: 'user', 'bot', or 'draw'
+        note: Why the winner won (from resolve_round_tool)
+    """
+
+    round_number: int
+    user_move: str
+    bot_move: str
+    winner: str
+    note: str
+
+
+@dataclass(slots=True)
 class GameState:
     """Complete game state that persists across all 3 rounds.
     
@@ -81,21 +220,39 @@ class GameState:
         round_index: Number of rounds completed (0-2, incremented after each round)
         user_score: Number of rounds won by the user
         bot_score: Number of rounds won by the bot
-        bombs_used: Dict tracking if each player has used their one bomb
-        history: List of dicts recording all past rounds for replay/analysis
+        user_bomb_used: True once the user has played their one bomb
+        bot_bomb_used: True once the bot has played its one bomb
+        history: Deque of RoundRecords for replay/analysis
+            (keeps the most recent MAX_HISTORY rounds)
     
     Design Note:
         This dataclass is deliberately separate from RefereeAgent to:
         1. Make it easy to test state updates independently
-        2. Allow serialization (to JSON, database, etc.)
+        2. Allow serialization (to JSON, database, etc.) via to_dict()
         3. Keep data and logic concerns separated (good practice)
+    
+    Note:
+        dataclasses.asdict(state) is not JSON-serializable because history is
+        a deque; use to_dict(), which converts it to a list of dicts.
     """
 
     round_index: int = 0
     user_score: int = 0
     bot_score: int = 0
-    bombs_used: Dict[str, bool] = field(default_factory=lambda: {"user": False, "bot": False})
-    history: List[Dict[str, str]] = field(default_factory=list)
+    user_bomb_used: bool = False
+    bot_bomb_used: bool = False
+    history: Deque[RoundRecord] = field(default_factory=lambda: deque(maxlen=MAX_HISTORY))
+
+    def to_dict(self) -> Dict[str, object]:
+        """Return a JSON-serializable dict (history as a list of record dicts)."""
+        return {
+            "round_index": self.round_index,
+            "user_score": self.user_score,
+            "bot_score": self.bot_score,
+            "user_bomb_used": self.user_bomb_used,
+            "bot_bomb_used": self.bot_bomb_used,
+            "history": [record._asdict() for record in self.history],
+        }
 
 
 # ============================================================================
@@ -106,6 +263,29 @@ class GameState:
 # Design benefit: Easy to test, reuse, and reason about.
 
 
+def _invalid_move_reason(move: Optional[str], player: str, state: GameState) -> Optional[str]:
+    """Return why a move is illegal, or None if it is allowed.
+    
+    Reasons are 'empty input', 'unknown move' and 'bomb already used'.
+    This is the shared rule check: play_round() uses it directly, so the
+    common valid case is a plain `is None` test, and validate_move_tool()
+    wraps it in a result dict for tool callers.
+    """
+    if move is _ROCK or move is _PAPER or move is _SCISSORS:
+        return None
+    if move is not _BOMB:
+        # Not a canonical move from interpret_intent(): check it the long way.
+        if not move:
+            return "empty input"
+        if not isinstance(move, str) or move not in VALID_MOVES:
+            return "unknown move"
+        if move != "bomb":
+            return None
+    if (player == "user" and state.user_bomb_used) or (player == "bot" and state.bot_bomb_used):
+        return "bomb already used"
+    return None
+
+
 def validate_move_tool(move: Optional[str], player: str, state: GameState) -> Dict[str, object]:
     """Validate a player's move against game rules.
     
@@ -127,16 +307,19 @@ def validate_move_tool(move: Optional[str], player: str, state: GameState) -> Di
         >>> validate_move_tool('rock', 'user', GameState())
         {'valid': True, 'reason': 'ok'}
         
-        >>> validate_move_tool('bomb', 'user', GameState(bombs_used={'user': True}))
+        >>> validate_move_tool('bomb', 'user', GameState(user_bomb_used=True))
         {'valid': False, 'reason': 'bomb already used'}
+    
+    Note:
+        There are only four possible answers, so they are prebuilt at import
+        time; each call returns a shallow copy, which callers may modify.
+        Moves returned by interpret_intent() are the interned canonical
+        strings, so they are recognised by identity without hashing.
     """
-    if not move:
-        return asdict(ValidationResult(valid=False, reason="empty input"))
-    if move not in VALID_MOVES:
-        return asdict(ValidationResult(valid=False, reason="unknown move"))
-    if move == "bomb" and state.bombs_used.get(player, False):
-        return asdict(ValidationResult(valid=False, reason="bomb already used"))
-    return asdict(ValidationResult(valid=True, reason="ok"))
+    reason = _invalid_move_reason(move, player, state)
+    if reason is None:
+        return dict(_VR_OK)
+    return dict(_VR_INVALID[reason])
 
 
 def resolve_round_tool(user_move: str, bot_move: str) -> Dict[str, str]:
@@ -159,18 +342,11 @@ def resolve_round_tool(user_move: str, bot_move: str) -> Dict[str, str]:
     
     Note:
         This is a pure function (no state mutation), making it easy to test.
+        All 16 results are prebuilt at import time (see _RESOLUTION), so a
+        call is a lookup plus a shallow two-key copy. The copy means callers
+        (e.g. ADK callbacks) can modify the result safely.
     """
-    if user_move == bot_move:
-        return asdict(ResolutionResult(winner="draw", explanation="Same move."))
-    if user_move == "bomb" and bot_move == "bomb":
-        return asdict(ResolutionResult(winner="draw", explanation="Bomb vs bomb is a draw."))
-    if user_move == "bomb":
-        return asdict(ResolutionResult(winner="user", explanation="Bomb beats all other moves."))
-    if bot_move == "bomb":
-        return asdict(ResolutionResult(winner="bot", explanation="Bomb beats all other moves."))
-    if RPS_BEATS[user_move] == bot_move:
-        return asdict(ResolutionResult(winner="user", explanation=f"{user_move} beats {bot_move}."))
-    return asdict(ResolutionResult(winner="bot", explanation=f"{bot_move} beats {user_move}."))
+    return dict(_RESOLUTION[(user_move, bot_move)])
 
 
 def update_game_state_tool(
@@ -196,28 +372,24 @@ def update_game_state_tool(
         outcome_note: Why the winner won (from resolve_round_tool)
     
     Returns:
-        Updated GameState with incremented scores and history
+        The same GameState object, updated in place (returned for convenience;
+        callers holding a reference need not reassign it)
     
     Design Note:
-        This is the only function that mutates state.
+        This is the only function that mutates state (RefereeAgent.play_round_fast()
+        inlines exactly these steps; keep the two in sync).
         Centralizing mutations here makes debugging easier.
     """
     if user_move == "bomb":
-        state.bombs_used["user"] = True
+        state.user_bomb_used = True
     if bot_move == "bomb":
-        state.bombs_used["bot"] = True
+        state.bot_bomb_used = True
     if winner == "user":
         state.user_score += 1
     elif winner == "bot":
         state.bot_score += 1
     state.history.append(
-        {
-            "round": str(state.round_index + 1),
-            "user_move": user_move,
-            "bot_move": bot_move,
-            "winner": winner,
-            "note": outcome_note,
-        }
+        RoundRecord(state.round_index + 1, user_move, bot_move, winner, outcome_note)
     )
     state.round_index += 1
     return state
@@ -254,9 +426,9 @@ class RefereeAgent:
         """Parse user text into a recognized move.
         
         This implements exact-match parsing:
+        - Strip whitespace (only if there is any)
         - Lowercase input
-        - Strip whitespace
-        - Check against VALID_MOVES
+        - Look up the canonical move in _MOVE_ALIASES
         
         Why exact-match? Because deterministic games should have clear rules.
         No fuzzy matching (e.g., 'r' → 'rock') to avoid confusion.
@@ -275,39 +447,42 @@ class RefereeAgent:
             >>> agent.interpret_intent('lizard')
             None  # Triggers validation error in play_round()
         """
-        normalized = user_text.strip().lower()
-        return normalized if normalized in VALID_MOVES else None
+        if user_text[:1].isspace() or user_text[-1:].isspace():
+            user_text = user_text.strip()
+        return _MOVE_ALIASES.get(user_text.lower())
 
     def choose_bot_move(self) -> str:
         """Select the bot's next move.
         
         Strategy (intentionally simple to keep code readable):
-        - Randomly pick from [rock, paper, scissors]
-        - If bot hasn't used bomb AND (it's round 3 OR bot is losing), add bomb to choices
-        - Randomly pick from final pool
+        - Default pool: (rock, paper, scissors)
+        - If bot hasn't used bomb AND (it's round 3 OR bot is losing), use the pool with bomb
+        - Randomly pick from that pool
         
         Why simple? Beginners can understand it. Replace this with ML/strategy later.
         
         Returns:
             One of VALID_MOVES: 'rock', 'paper', 'scissors', or 'bomb'
         """
-        moves = ["rock", "paper", "scissors"]
-        if not self.state.bombs_used["bot"]:
-            if self.state.round_index == 2 or self.state.bot_score < self.state.user_score:
-                moves.append("bomb")
-        return random.choice(moves)
+        state = self.state
+        pool: Tuple[str, ...] = _BOT_MOVES_NO_BOMB
+        if not state.bot_bomb_used:
+            if state.round_index == 2 or state.bot_score < state.user_score:
+                pool = _BOT_MOVES_WITH_BOMB
+        return pool[_randrange(len(pool))]
 
     def play_round(self, user_text: str) -> str:
         """Execute one complete game round.
         
         Flow (the three-stage model explained in README):
         1. INTERPRET: Parse user text → move
-        2. VALIDATE: Check move is legal via validate_move_tool()
+        2. VALIDATE: Check move is legal (same rules as validate_move_tool())
            - If invalid: return error message, DON'T advance round
         3. EXECUTE & RESOLVE:
            - Bot picks move via choose_bot_move()
-           - Determine winner via resolve_round_tool()
-        4. UPDATE: Apply outcome to state via update_game_state_tool()
+           - Determine winner (same rules as resolve_round_tool(), read
+             from the immutable _OUTCOME_TABLE)
+        4. UPDATE: Apply outcome to state via update_game_state_tool() (in place)
         5. DISPLAY: Format friendly output via format_round_response()
         
         Args:
@@ -318,27 +493,82 @@ class RefereeAgent:
             - On invalid input: error message (round not consumed)
             - On valid input: round summary with scores
         """
-        round_number = self.state.round_index + 1
+        state = self.state
+        round_number = state.round_index + 1
         user_move = self.interpret_intent(user_text)
-        validation = validate_move_tool(user_move, "user", self.state)
-        if not validation["valid"]:
-            return "\n".join(
-                [
-                    "Invalid move.",
-                    f"Reason: {validation['reason']}.",
-                    "Please enter rock, paper, scissors, or bomb.",
-                ]
-            )
+        if user_move is None:
+            return _INVALID_MESSAGES["empty input"]
+        reason = _invalid_move_reason(user_move, "user", state)
+        if reason is not None:
+            return _INVALID_MESSAGES[reason]
 
         bot_move = self.choose_bot_move()
-        result = resolve_round_tool(user_move, bot_move)
-        self.state = update_game_state_tool(
-            self.state,
-            user_move,
-            bot_move,
-            result["winner"],
-            result["explanation"],
-        )
+        winner, explanation = _OUTCOME_TABLE[MOVE_IDS[user_move] * 4 + MOVE_IDS[bot_move]]
+        update_game_state_tool(state, user_move, bot_move, winner, explanation)
+        return self.format_round_response(round_number)
+
+    def play_round_fast(
+        self,
+        user_text: str,
+        _codes: Mapping[str, int] = _MOVE_CODE_ALIASES,
+        _names: Tuple[str, ...] = MOVE_NAMES,
+        _outcomes: Tuple[Tuple[str, str], ...] = _OUTCOME_TABLE,
+        _rr: Callable[[int], int] = _randrange,
+    ) -> str:
+        """Execute one round like play_round(), with the tool calls inlined.
+        
+        Produces the same output and state changes as play_round(), but does
+        interpret → validate → bot move → resolve → update in one function
+        body using local variables and integer move codes (see Move), with
+        no intermediate result dicts. Meant for high-throughput callers
+        (servers, simulations); the CLI keeps using the readable play_round().
+        
+        The trailing underscore arguments bind module globals as locals
+        (a CPython speed trick) and should never be passed by callers.
+        
+        Note:
+            The bot strategy of choose_bot_move() is inlined too, so
+            overriding choose_bot_move() does not affect this method.
+            Likewise, _randrange is bound when the method is defined, so
+            patching main._randrange (e.g. in a test) changes play_round()
+            but not this method.
+        
+        Args:
+            user_text: Raw user input (e.g., 'rock')
+        
+        Returns:
+            Same strings as play_round()
+        """
+        state = self.state
+        if user_text[:1].isspace() or user_text[-1:].isspace():
+            user_text = user_text.strip()
+        user_code = _codes.get(user_text.lower())
+        if user_code is None:
+            return _INVALID_MESSAGES["empty input"]
+        if user_code == _BOMB_CODE and state.user_bomb_used:
+            return _INVALID_MESSAGES["bomb already used"]
+
+        if not state.bot_bomb_used and (
+            state.round_index == 2 or state.bot_score < state.user_score
+        ):
+            bot_code = _rr(4)
+        else:
+            bot_code = _rr(3)
+        winner, explanation = _outcomes[user_code * 4 + bot_code]
+        user_move = _names[user_code]
+        bot_move = _names[bot_code]
+
+        if user_code == _BOMB_CODE:
+            state.user_bomb_used = True
+        if bot_code == _BOMB_CODE:
+            state.bot_bomb_used = True
+        if winner == "user":
+            state.user_score += 1
+        elif winner == "bot":
+            state.bot_score += 1
+        round_number = state.round_index + 1
+        state.history.append(RoundRecord(round_number, user_move, bot_move, winner, explanation))
+        state.round_index = round_number
         return self.format_round_response(round_number)
 
     def format_round_response(self, round_number: int) -> str:
@@ -361,28 +591,16 @@ class RefereeAgent:
         Returns:
             Formatted string ready to print
         """
-        record = self.state.history[-1]
-        winner = record["winner"]
-        if winner == "user":
-            winner_text = "You"
-        elif winner == "bot":
-            winner_text = "Bot"
-        else:
-            winner_text = "Draw"
-        user_move = MOVE_EMOJI.get(record["user_move"], record["user_move"])
-        bot_move = MOVE_EMOJI.get(record["bot_move"], record["bot_move"])
-        return "\n".join(
-            [
-                "",
-                "==== Round Result ====",
-                f"Round {round_number}/3",
-                f"Moves: You={user_move} | Bot={bot_move}",
-                f"Winner: {winner_text}",
-                f"Reason: {record['note']}",
-                f"Score: You {self.state.user_score} - Bot {self.state.bot_score}",
-                "======================",
-                "",
-            ]
+        state = self.state
+        record = state.history[-1]
+        return (
+            "\n==== Round Result ====\n"
+            f"Round {round_number}/3\n"
+            f"{_MOVES_LINE[record.user_move, record.bot_move]}\n"
+            f"Winner: {_WINNER_TEXT[record.winner]}\n"
+            f"Reason: {record.note}\n"
+            f"Score: You {state.user_score} - Bot {state.bot_score}\n"
+            "======================\n"
         )
 
 
@@ -391,44 +609,59 @@ class RefereeAgent:
 # ============================================================================
 
 
+# Game rules shown at match start. They never change, so the text is a
+# constant; rules_text() is kept as the function-style accessor.
+RULES_TEXT = (
+    "\n"
+    "Best of 3 rounds. Valid moves: rock, paper, scissors, bomb (once per player).\n"
+    "Move emojis: rock 🪨, paper 📄, scissors ✂️, bomb 💣\n"
+    "Bomb beats everything; bomb vs bomb is a draw.\n"
+    "Invalid input triggers a warning and re-prompt.\n"
+    "Game ends automatically after 3 rounds.\n"
+)
+
+# Filled in by final_result() with %-substitution.
+_FINAL_TEMPLATE = "\nGame Over\nFinal Score: You %d - Bot %d\nResult: %s\n"
+
+
 def rules_text() -> str:
     """Return the game rules for display at match start.
     
     Shown once at the beginning so players understand the rules.
+    Same as the RULES_TEXT constant.
     """
-    return "\n".join(
-        [
-            "",
-            "Best of 3 rounds. Valid moves: rock, paper, scissors, bomb (once per player).",
-            "Move emojis: rock 🪨, paper 📄, scissors ✂️, bomb 💣",
-            "Bomb beats everything; bomb vs bomb is a draw.",
-            "Invalid input triggers a warning and re-prompt.",
-            "Game ends automatically after 3 rounds.",
-            "",
-        ]
-    )
+    return RULES_TEXT
 
 
-def final_result(state: GameState) -> str:
-    """Format the final score and outcome.
-    
-    Shown after all 3 rounds are complete.
-    """
-    if state.user_score > state.bot_score:
+def _build_final_result(user_score: int, bot_score: int) -> str:
+    """Format the final score and outcome for one pair of scores."""
+    if user_score > bot_score:
         result = "User wins"
-    elif state.bot_score > state.user_score:
+    elif bot_score > user_score:
         result = "Bot wins"
     else:
         result = "Draw"
-    return "\n".join(
-        [
-            "",
-            "Game Over",
-            f"Final Score: You {state.user_score} - Bot {state.bot_score}",
-            f"Result: {result}",
-            "",
-        ]
-    )
+    return _FINAL_TEMPLATE % (user_score, bot_score, result)
+
+
+# A 3-round game can only end with scores 0-3, so all 16 summaries are prebuilt.
+_FINAL_RESULTS = {
+    (user_score, bot_score): _build_final_result(user_score, bot_score)
+    for user_score in range(4)
+    for bot_score in range(4)
+}
+
+
+def final_result(state: GameState) -> str:
+    """Format the final score and outcome.
+    
+    Shown after all 3 rounds are complete. Common scores come straight
+    from the _FINAL_RESULTS table; anything else is formatted on demand.
+    """
+    text = _FINAL_RESULTS.get((state.user_score, state.bot_score))
+    if text is None:
+        text = _build_final_result(state.user_score, state.bot_score)
+    return text
 
 
 def main() -> None:
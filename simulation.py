@@ -0,0 +1,315 @@
+"""Batch simulation helpers for Rock-Paper-Scissors-Plus.
+
+The referee in main.py plays one human-speed round at a time. When you
+want to evaluate bot strategies over millions of rounds, calling the
+tools once per round is far too slow. This module works on integer-encoded
+moves instead, so the inner loops can be compiled.
+
+Numba is optional:
+- If it is installed (pip install numba), kernels are JIT-compiled and
+  cached on disk, so only the first run pays the compile cost.
+- If it is not, the same functions run as plain Python loops.
+
+NumPy (installed along with Numba) is needed only for simulate_matches();
+without it, encode_moves() returns plain lists.
+
+For Monte-Carlo rollouts, a whole GameState (minus history) also packs
+into one small int; see pack(), unpack() and step().
+
+Usage:
+    import numpy
+    from simulation import encode_moves, resolve_batch
+    user = encode_moves(["rock", "bomb"])
+    bot = encode_moves(["scissors", "paper"])
+    out = numpy.zeros(len(user), dtype=numpy.int8)  # [0] * len(user) without NumPy
+    resolve_batch(user, bot, out)  # out == [USER_WINS, USER_WINS]
+"""
+
+from typing import Any, Iterable, Optional, Tuple
+
+from main import MOVE_IDS, MOVE_NAMES, GameState, Move, RoundRecord, resolve_round_tool
+
+try:
+    import numpy as np
+except ImportError:  # NumPy not installed: only simulate_matches() needs it.
+    np = None  # type: ignore[assignment]
+
+try:
+    from numba import njit, prange  # type: ignore[import-not-found]
+except ImportError:  # Numba not installed: run the kernels as plain Python.
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """No-op stand-in for numba.njit (supports @njit and @njit(...))."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range  # type: ignore[misc]
+
+
+# ============================================================================
+# INTEGER ENCODING
+# ============================================================================
+
+# Move codes come from main.Move (rock=0, paper=1, scissors=2, bomb=3),
+# where "a beats b" is simply (a - b) % 3 == 1. Kernels use plain ints.
+BOMB = int(Move.BOMB)
+
+# Winner codes written by resolve_batch() and simulate_matches().
+DRAW = 0
+USER_WINS = 1
+BOT_WINS = 2
+
+# Winner string (as stored in RoundRecord.winner) → winner code.
+WINNER_CODES = {"draw": DRAW, "user": USER_WINS, "bot": BOT_WINS}
+
+# Columns of one round in the simulate_matches() result.
+COL_USER_MOVE = 0
+COL_BOT_MOVE = 1
+COL_WINNER = 2
+COL_USER_SCORE = 3
+COL_BOT_SCORE = 4
+
+
+def encode_moves(moves: Iterable[str]) -> Any:
+    """Convert move names to integer codes (see main.Move).
+
+    Returns an int8 NumPy array when NumPy is installed (what compiled
+    kernels expect), otherwise a list of ints.
+    """
+    codes = [int(MOVE_IDS[move]) for move in moves]
+    if np is None:
+        return codes
+    return np.array(codes, dtype=np.int8)
+
+
+def history_to_arrays(history: Iterable[RoundRecord]) -> Tuple[Any, Any, Any]:
+    """Convert GameState.history into three int8 NumPy arrays (SoA layout).
+
+    GameState keeps RoundRecords because the CLI reads them one at a time.
+    For analytics ("how often does the bot win after I play rock?") one
+    array per field lets NumPy do the counting, e.g.
+    (winners == BOT_WINS).sum().
+
+    Args:
+        history: RoundRecords, e.g. state.history
+
+    Returns:
+        (user_moves, bot_moves, winners): move codes and winner codes
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    if np is None:
+        raise ImportError("history_to_arrays() requires numpy (pip install numpy)")
+    records = list(history)
+    count = len(records)
+    user_moves = np.fromiter((MOVE_IDS[r.user_move] for r in records), np.int8, count)
+    bot_moves = np.fromiter((MOVE_IDS[r.bot_move] for r in records), np.int8, count)
+    winners = np.fromiter((WINNER_CODES[r.winner] for r in records), np.int8, count)
+    return user_moves, bot_moves, winners
+
+
+# ============================================================================
+# KERNELS
+# ============================================================================
+
+
+@njit(cache=True)
+def _winner_code(user, bot):
+    """Winner code for one round: same rules as resolve_round_tool()."""
+    if user == bot:
+        return DRAW
+    if user == BOMB:
+        return USER_WINS
+    if bot == BOMB:
+        return BOT_WINS
+    if (user - bot) % 3 == 1:
+        return USER_WINS
+    return BOT_WINS
+
+
+@njit(cache=True, parallel=True)
+def resolve_batch(user_moves, bot_moves, out):
+    """Resolve many rounds at once, writing winner codes into out.
+
+    Same rules as resolve_round_tool(), on integer codes:
+    same move → DRAW, bomb beats everything else, otherwise classic RPS.
+
+    Args:
+        user_moves: Sequence/array of user move codes
+        bot_moves: Sequence/array of bot move codes (same length)
+        out: Preallocated sequence/array receiving DRAW, USER_WINS or BOT_WINS
+    """
+    for i in prange(len(user_moves)):
+        out[i] = _winner_code(user_moves[i], bot_moves[i])
+
+
+@njit(cache=True, parallel=True)
+def _simulate_kernel(user_moves, bot_rolls, out):
+    """Play every match in user_moves against the bot (see simulate_matches)."""
+    for i in prange(user_moves.shape[0]):
+        user_score = 0
+        bot_score = 0
+        bot_bomb_used = False
+        for r in range(3):
+            # Same strategy as RefereeAgent.choose_bot_move(): the pool index
+            # is the move code, and bomb is only in the pool when allowed.
+            if not bot_bomb_used and (r == 2 or bot_score < user_score):
+                bot = int(bot_rolls[i, r] * 4)
+            else:
+                bot = int(bot_rolls[i, r] * 3)
+            if bot == BOMB:
+                bot_bomb_used = True
+            user = user_moves[i, r]
+            winner = _winner_code(user, bot)
+            if winner == USER_WINS:
+                user_score += 1
+            elif winner == BOT_WINS:
+                bot_score += 1
+            out[i, r, COL_USER_MOVE] = user
+            out[i, r, COL_BOT_MOVE] = bot
+            out[i, r, COL_WINNER] = winner
+            out[i, r, COL_USER_SCORE] = user_score
+            out[i, r, COL_BOT_SCORE] = bot_score
+
+
+def simulate_matches(user_moves: Any, seed: Optional[int] = None) -> Any:
+    """Play many full 3-round matches of scripted user moves against the bot.
+
+    The bot follows the same strategy as RefereeAgent.choose_bot_move().
+    Its random numbers are drawn up front from numpy.random.default_rng(seed),
+    so results are reproducible for a given seed, with or without Numba.
+
+    Args:
+        user_moves: Array-like of shape (n_matches, 3) with user move codes.
+            Moves are assumed valid (at most one bomb per match), exactly
+            like update_game_state_tool().
+        seed: Seed for the bot's random choices (None for a fresh one)
+
+    Returns:
+        int8 array of shape (n_matches, 3, 5). For each round, the columns
+        are COL_USER_MOVE, COL_BOT_MOVE, COL_WINNER, COL_USER_SCORE and
+        COL_BOT_SCORE (the last two are running scores after the round).
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    if np is None:
+        raise ImportError("simulate_matches() requires numpy (pip install numpy)")
+    user_moves = np.ascontiguousarray(user_moves, dtype=np.int8)
+    if user_moves.ndim != 2 or user_moves.shape[1] != 3:
+        raise ValueError(f"user_moves must have shape (n_matches, 3), got {user_moves.shape}")
+    bot_rolls = np.random.default_rng(seed).random(user_moves.shape)
+    out = np.zeros(user_moves.shape + (5,), dtype=np.int8)
+    _simulate_kernel(user_moves, bot_rolls, out)
+    return out
+
+
+# ============================================================================
+# PACKED GAME STATE
+# ============================================================================
+# A GameState (without history) fits in 8 bits:
+#
+#   bit:   7          6           5-4         3-2          1-0
+#        bot bomb   user bomb   bot_score   user_score   round_index
+#
+# Every field is at most 3 (a game has 3 rounds), so 2 bits each is enough.
+# Scores never add up to more than round_index, so no field overflows into
+# the next one.
+
+ROUND_SHIFT = 0
+USER_SCORE_SHIFT = 2
+BOT_SCORE_SHIFT = 4
+USER_BOMB_BIT = 1 << 6
+BOT_BOMB_BIT = 1 << 7
+FIELD_MASK = 0b11
+BOMBS_MASK = 0b11 << 6
+STATE_COUNT = 1 << 8
+
+
+def pack(state: GameState) -> int:
+    """Encode a GameState as an int (history is not stored).
+
+    Raises:
+        ValueError: If round_index or a score does not fit in 2 bits, or
+            the scores add up to more than the rounds played
+    """
+    for value in (state.round_index, state.user_score, state.bot_score):
+        if not 0 <= value <= FIELD_MASK:
+            raise ValueError(f"cannot pack state with field value {value}")
+    if state.user_score + state.bot_score > state.round_index:
+        raise ValueError(
+            f"cannot pack state with scores {state.user_score}-{state.bot_score} "
+            f"after {state.round_index} rounds"
+        )
+    packed = (
+        state.round_index << ROUND_SHIFT
+        | state.user_score << USER_SCORE_SHIFT
+        | state.bot_score << BOT_SCORE_SHIFT
+    )
+    if state.user_bomb_used:
+        packed |= USER_BOMB_BIT
+    if state.bot_bomb_used:
+        packed |= BOT_BOMB_BIT
+    return packed
+
+
+def unpack(packed: int) -> GameState:
+    """Decode an int from pack() back into a GameState (with empty history)."""
+    return GameState(
+        round_index=(packed >> ROUND_SHIFT) & FIELD_MASK,
+        user_score=(packed >> USER_SCORE_SHIFT) & FIELD_MASK,
+        bot_score=(packed >> BOT_SCORE_SHIFT) & FIELD_MASK,
+        user_bomb_used=bool(packed & USER_BOMB_BIT),
+        bot_bomb_used=bool(packed & BOT_BOMB_BIT),
+    )
+
+
+def _step_slow(packed: int, user_move: int, bot_move: int) -> int:
+    """Apply one round with bit operations (used to build _STEP_TABLE).
+
+    Mirrors update_game_state_tool(). Finished games (round_index == 3)
+    and impossible states that pack() rejects (more points than rounds
+    played) are left unchanged, so a score never carries into the next field.
+    """
+    round_index = (packed >> ROUND_SHIFT) & FIELD_MASK
+    user_score = (packed >> USER_SCORE_SHIFT) & FIELD_MASK
+    bot_score = (packed >> BOT_SCORE_SHIFT) & FIELD_MASK
+    if round_index == 3 or user_score + bot_score > round_index:
+        return packed
+    if user_move == BOMB:
+        packed |= USER_BOMB_BIT
+    if bot_move == BOMB:
+        packed |= BOT_BOMB_BIT
+    winner = resolve_round_tool(MOVE_NAMES[user_move], MOVE_NAMES[bot_move])["winner"]
+    if winner == "user":
+        packed += 1 << USER_SCORE_SHIFT
+    elif winner == "bot":
+        packed += 1 << BOT_SCORE_SHIFT
+    return packed + (1 << ROUND_SHIFT)
+
+
+# Next state for every (state, user_move, bot_move): 256 x 4 x 4 entries,
+# indexed by (packed << 4) | (user_move << 2) | bot_move.
+_STEP_TABLE = tuple(
+    _step_slow(packed, user_move, bot_move)
+    for packed in range(STATE_COUNT)
+    for user_move in range(4)
+    for bot_move in range(4)
+)
+
+
+def step(packed: int, user_move: int, bot_move: int) -> int:
+    """Return the packed state after one round (a single table lookup).
+
+    Moves are integer codes (see MOVE_IDS) and are assumed to be valid,
+    exactly like update_game_state_tool(). Finished games (and states
+    pack() would reject) stay unchanged, so the result is always < STATE_COUNT.
+
+    Raises:
+        ValueError: If packed is not in range(STATE_COUNT)
+    """
+    if not 0 <= packed < STATE_COUNT:
+        raise ValueError(f"cannot step packed state {packed}")
+    return _STEP_TABLE[packed << 4 | user_move << 2 | bot_move]
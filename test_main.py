@@ -13,9 +13,14 @@ Design principle:
     We pass in mock states and verify outputs.
 """
 
+import json
+import random
 import unittest
+from unittest.mock import patch
 
 from main import (
+    MOVE_IDS,
+    RPS_BEATS,
     GameState,
     RefereeAgent,
     resolve_round_tool,
@@ -43,11 +48,20 @@ class TestRefereeTools(unittest.TestCase):
 
     def test_validate_move_rejects_reused_bomb(self) -> None:
         """Test that validate_move_tool() enforces one-bomb-per-player rule."""
-        state = GameState(bombs_used={"user": True, "bot": False})
+        state = GameState(user_bomb_used=True)
         result = validate_move_tool("bomb", "user", state)
         self.assertFalse(result["valid"])
         self.assertEqual(result["reason"], "bomb already used")
 
+    def test_mutating_validation_does_not_leak(self) -> None:
+        """Test that editing a validate_move_tool() result can't change later calls."""
+        validate_move_tool("rock", "user", GameState())["valid"] = False
+        validate_move_tool("lizard", "user", GameState())["reason"] = "redacted"
+        self.assertEqual(
+            validate_move_tool("paper", "user", GameState()), {"valid": True, "reason": "ok"}
+        )
+        self.assertEqual(validate_move_tool("lizard", "user", GameState())["reason"], "unknown move")
+
     def test_resolve_round_draws(self) -> None:
         """Test that resolve_round_tool() correctly identifies draws."""
         result = resolve_round_tool("rock", "rock")
@@ -55,6 +69,49 @@ class TestRefereeTools(unittest.TestCase):
         result = resolve_round_tool("bomb", "bomb")
         self.assertEqual(result["winner"], "draw")
 
+    def test_resolve_round_winners(self) -> None:
+        """Test that resolve_round_tool() picks the right winner and reason."""
+        result = resolve_round_tool("rock", "scissors")
+        self.assertEqual(result["winner"], "user")
+        self.assertEqual(result["explanation"], "rock beats scissors.")
+        result = resolve_round_tool("rock", "paper")
+        self.assertEqual(result["winner"], "bot")
+        self.assertEqual(result["explanation"], "paper beats rock.")
+        result = resolve_round_tool("scissors", "bomb")
+        self.assertEqual(result["winner"], "bot")
+
+    def test_move_codes_match_rps_beats(self) -> None:
+        """Test that the Move arithmetic (a - b) % 3 == 1 encodes RPS_BEATS exactly."""
+        for a in RPS_BEATS:
+            for b in RPS_BEATS:
+                self.assertEqual((MOVE_IDS[a] - MOVE_IDS[b]) % 3 == 1, RPS_BEATS[a] == b)
+
+    def test_tool_results_are_json_serializable(self) -> None:
+        """Test that tool results are plain dicts (ADK serializes them to JSON)."""
+        validation = validate_move_tool("rock", "user", GameState())
+        self.assertEqual(json.loads(json.dumps(validation)), {"valid": True, "reason": "ok"})
+        resolution = resolve_round_tool("paper", "rock")
+        self.assertEqual(
+            json.loads(json.dumps(resolution)),
+            {"winner": "user", "explanation": "paper beats rock."},
+        )
+
+    def test_mutating_resolution_does_not_leak(self) -> None:
+        """Test that editing a resolve_round_tool() result can't change later rounds."""
+        result = resolve_round_tool("rock", "scissors")
+        result["winner"] = "bot"
+        result["explanation"] = "redacted"
+        self.assertEqual(
+            resolve_round_tool("rock", "scissors"),
+            {"winner": "user", "explanation": "rock beats scissors."},
+        )
+
+        agent = RefereeAgent(GameState())
+        with patch.object(agent, "choose_bot_move", return_value="scissors"):
+            response = agent.play_round("rock")
+        self.assertIn("Reason: rock beats scissors.", response)
+        self.assertEqual((agent.state.user_score, agent.state.bot_score), (1, 0))
+
     def test_update_state_scores_and_rounds(self) -> None:
         """Test that update_game_state_tool() correctly updates scores and history."""
         state = GameState()
@@ -70,7 +127,16 @@ class TestRefereeTools(unittest.TestCase):
         self.assertEqual(updated.bot_score, 0)
 
         # Check history recording
-        self.assertEqual(updated.history[-1]["winner"], "user")
+        self.assertEqual(updated.history[-1].winner, "user")
+        self.assertEqual(updated.history[-1].round_number, 1)
+
+    def test_state_to_dict_is_json_serializable(self) -> None:
+        """Test that GameState.to_dict() turns the history deque into JSON-ready dicts."""
+        state = update_game_state_tool(GameState(), "bomb", "rock", "user", "Bomb beats all other moves.")
+        data = json.loads(json.dumps(state.to_dict()))
+        self.assertTrue(data["user_bomb_used"])
+        self.assertEqual(data["history"][0]["user_move"], "bomb")
+        self.assertEqual(data["history"][0]["round_number"], 1)
 
 
 class TestAgentFlow(unittest.TestCase):
@@ -96,7 +162,7 @@ class TestAgentFlow(unittest.TestCase):
         self.assertIn("Invalid move", response)
 
         # Should NOT add to history
-        self.assertEqual(agent.state.history, [])
+        self.assertEqual(len(agent.state.history), 0)
 
     def test_intent_requires_exact_input(self) -> None:
         """Test that interpret_intent() does exact-match parsing (no fuzzy matching)."""
@@ -112,6 +178,20 @@ class TestAgentFlow(unittest.TestCase):
         self.assertIsNone(agent.interpret_intent("stone"))  # Typo
         self.assertIsNone(agent.interpret_intent("bomb!"))  # Special char
 
+    def test_play_round_fast_matches_play_round(self) -> None:
+        """Test that play_round_fast() gives the same output and state as play_round()."""
+        inputs = ["rock", "lizard", "  BOMB ", "bomb", "", "paper", "scissors"]
+        slow_agent = RefereeAgent(GameState())
+        fast_agent = RefereeAgent(GameState())
+
+        random.seed(1234)
+        slow_output = [slow_agent.play_round(text) for text in inputs]
+        random.seed(1234)
+        fast_output = [fast_agent.play_round_fast(text) for text in inputs]
+
+        self.assertEqual(fast_output, slow_output)
+        self.assertEqual(fast_agent.state, slow_agent.state)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,155 @@
+"""Unit tests for the batch simulation helpers.
+
+Run tests:
+    python -m unittest test_simulation.py -v
+
+These run with or without Numba installed: without it, the kernels are
+plain Python functions and accept ordinary lists. simulate_matches() tests
+are skipped when NumPy is missing.
+"""
+
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+from main import GameState, RefereeAgent, VALID_MOVES, resolve_round_tool, update_game_state_tool
+from simulation import (
+    COL_BOT_MOVE,
+    COL_BOT_SCORE,
+    COL_USER_SCORE,
+    COL_WINNER,
+    MOVE_IDS,
+    MOVE_NAMES,
+    STATE_COUNT,
+    WINNER_CODES,
+    encode_moves,
+    history_to_arrays,
+    pack,
+    resolve_batch,
+    simulate_matches,
+    step,
+    unpack,
+)
+
+
+class TestResolveBatch(unittest.TestCase):
+    """Test that the integer kernel agrees with resolve_round_tool()."""
+
+    def test_matches_resolve_round_tool(self) -> None:
+        """Test every (user_move, bot_move) pair against the referee tool."""
+        pairs = [(user, bot) for user in sorted(VALID_MOVES) for bot in sorted(VALID_MOVES)]
+        user_moves = encode_moves(user for user, _ in pairs)
+        bot_moves = encode_moves(bot for _, bot in pairs)
+        if np is None:
+            out = [-1] * len(pairs)
+        else:
+            out = np.full(len(pairs), -1, dtype=np.int8)
+
+        resolve_batch(user_moves, bot_moves, out)
+
+        expected = [WINNER_CODES[resolve_round_tool(user, bot)["winner"]] for user, bot in pairs]
+        self.assertEqual([int(code) for code in out], expected)
+
+
+@unittest.skipIf(np is None, "simulate_matches() requires numpy")
+class TestSimulateMatches(unittest.TestCase):
+    """Test the batch match simulator against the referee tools."""
+
+    def test_matches_follow_referee_rules(self) -> None:
+        """Test that every simulated round agrees with the referee tools."""
+        rng = np.random.default_rng(7)
+        user_moves = rng.integers(0, 3, size=(500, 3))
+        user_moves[::5, 2] = MOVE_IDS["bomb"]  # Some users save their bomb for round 3
+
+        matches = simulate_matches(user_moves, seed=11)
+
+        self.assertEqual(matches.shape, (500, 3, 5))
+        for match_moves, match in zip(user_moves, matches):
+            state = GameState()
+            for user_code, result in zip(match_moves, match):
+                bot_move = MOVE_NAMES[result[COL_BOT_MOVE]]
+                if bot_move == "bomb":
+                    self.assertFalse(state.bot_bomb_used)
+                    self.assertTrue(state.round_index == 2 or state.bot_score < state.user_score)
+                outcome = resolve_round_tool(MOVE_NAMES[user_code], bot_move)
+                self.assertEqual(result[COL_WINNER], WINNER_CODES[outcome["winner"]])
+                update_game_state_tool(
+                    state, MOVE_NAMES[user_code], bot_move, outcome["winner"], outcome["explanation"]
+                )
+                self.assertEqual(result[COL_USER_SCORE], state.user_score)
+                self.assertEqual(result[COL_BOT_SCORE], state.bot_score)
+
+    def test_seed_is_reproducible(self) -> None:
+        """Test that the same seed gives the same bot moves."""
+        user_moves = np.zeros((50, 3), dtype=np.int8)
+        first = simulate_matches(user_moves, seed=3)
+        second = simulate_matches(user_moves, seed=3)
+        self.assertTrue((first == second).all())
+
+    def test_history_to_arrays(self) -> None:
+        """Test that history converts to per-field code arrays."""
+        agent = RefereeAgent(GameState())
+        for text in ("rock", "paper", "bomb"):
+            agent.play_round(text)
+
+        user_moves, bot_moves, winners = history_to_arrays(agent.state.history)
+
+        self.assertEqual(user_moves.tolist(), encode_moves(["rock", "paper", "bomb"]).tolist())
+        self.assertEqual(
+            bot_moves.tolist(), [MOVE_IDS[r.bot_move] for r in agent.state.history]
+        )
+        self.assertEqual(winners.tolist(), [WINNER_CODES[r.winner] for r in agent.state.history])
+
+
+class TestPackedState(unittest.TestCase):
+    """Test the int-packed GameState used for rollouts."""
+
+    def test_pack_round_trip(self) -> None:
+        """Test that unpack(pack(state)) restores every packed field."""
+        state = GameState(round_index=2, user_score=1, bot_score=1, bot_bomb_used=True)
+        restored = unpack(pack(state))
+        self.assertEqual(
+            (restored.round_index, restored.user_score, restored.bot_score),
+            (2, 1, 1),
+        )
+        self.assertFalse(restored.user_bomb_used)
+        self.assertTrue(restored.bot_bomb_used)
+
+    def test_step_matches_update_game_state_tool(self) -> None:
+        """Test that step() follows the same rules as the referee tools."""
+        rounds = [("rock", "scissors"), ("bomb", "paper"), ("paper", "bomb")]
+        state = GameState()
+        packed = pack(state)
+        for user_move, bot_move in rounds:
+            result = resolve_round_tool(user_move, bot_move)
+            update_game_state_tool(
+                state, user_move, bot_move, result["winner"], result["explanation"]
+            )
+            packed = step(packed, MOVE_IDS[user_move], MOVE_IDS[bot_move])
+        state.history.clear()
+        self.assertEqual(unpack(packed), state)
+
+    def test_pack_rejects_impossible_scores(self) -> None:
+        """Test that pack() refuses more points than rounds played."""
+        with self.assertRaises(ValueError):
+            pack(GameState(round_index=1, user_score=1, bot_score=1))
+
+    def test_step_rejects_out_of_range_state(self) -> None:
+        """Test that step() refuses packed values outside the 8-bit range."""
+        for packed in (-1, STATE_COUNT):
+            with self.assertRaises(ValueError):
+                step(packed, 0, 0)
+
+    def test_step_stays_in_state_range(self) -> None:
+        """Test that no step() result overflows the 8-bit packed state."""
+        for packed in range(STATE_COUNT):
+            for user_move in range(4):
+                for bot_move in range(4):
+                    self.assertLess(step(packed, user_move, bot_move), STATE_COUNT)
+
+
+if __name__ == "__main__":
+    unittest.main()